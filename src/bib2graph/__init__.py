@@ -5,15 +5,13 @@ Hito 1.5: costura ``TabularBackend`` + ``InMemoryBackend``.
 Hito 2: proyectores, analizadores, exportadores y ``Networks``.
 Hito 3: ``DuckDBBackend`` / ``DuckDBStore`` (biblioteca viva, carga perezosa).
 Hito 4: ``OpenAlexSource``, ``BibtexSource``, ``Source``, ``SeedResult``
-        (costura de siembra directa — httpx es núcleo, sin carga perezosa).
+        (costura de siembra directa).
 Hito 5: ``Forager``, ``RankedCandidates``, ``GrowthPreview``, ``Preprocessor``,
         ``apply_filters``, ``FilterCriterion`` (forrajeo + preprocessor + filtros
         PRISMA).
 R4: ``explain_candidate`` y el extra ``[llm]`` **eliminados** (ADR 0022).
         El *information scent* usa proyectores bibliométricos, sin IA generativa.
-Hito 6: CLI agente-native ``b2g`` (``bib2graph.cli``). 11 subcomandos:
-        ``seed``, ``chain``, ``filter``, ``build``, ``export``, ``snapshot``,
-        ``status``, ``inspect``, ``validate``, ``accept``, ``reject``.
+Hito 6: CLI agente-native ``b2g`` (``bib2graph.cli``).
 
 Símbolos públicos exportados:
   - Hito 1/1.5: ``Corpus``, ``Manifest``, ``CorpusSnapshot``, ``SchemaError``,
@@ -22,50 +20,26 @@ Símbolos públicos exportados:
     ``GraphMLExporter``, ``CsvExporter``, ``network_metrics``, ``centrality``,
     ``detect_communities``, ``assortativity``, ``community_composition``,
     ``cocitation_quality_report``, ``QualityThresholds``.
-  - Hito 3: ``DuckDBBackend``, ``DuckDBStore`` (carga perezosa — PEP 562).
-  - Hito 4: ``OpenAlexSource``, ``BibtexSource``, ``Source``, ``SeedResult``
-    (import directo; httpx es núcleo, sin efectos de import).
+  - Hito 3: ``DuckDBBackend``, ``DuckDBStore``.
+  - Hito 4: ``OpenAlexSource``, ``BibtexSource``, ``Source``, ``SeedResult``.
   - Hito 5: ``Forager``, ``RankedCandidates``, ``GrowthPreview``,
-    ``Preprocessor``, ``apply_filters``, ``FilterCriterion``
-    (import directo; núcleo puro sin efectos de import).
+    ``Preprocessor``, ``apply_filters``, ``FilterCriterion``.
 
-``DuckDBBackend`` y ``DuckDBStore`` se exponen vía ``__getattr__`` perezoso
-(PEP 562) para que ``import bib2graph`` NO importe ``duckdb`` y el smoke test
-del Hito 0 siga verde (``'duckdb' not in sys.modules`` tras el import).
-``OpenAlexSource`` y ``BibtexSource`` se importan directamente (httpx es
-núcleo — no hay efectos de import que deban diferirse).
+TODA la superficie pública se expone vía ``__getattr__`` perezoso (PEP 562):
+``import bib2graph`` NO importa networkx/pyarrow/duckdb/httpx — cada símbolo
+carga su submódulo recién en el primer acceso y queda cacheado en
+``globals()``.  Esto mantiene verde el smoke test del Hito 0 (sin efectos de
+import) y corta el arranque del CLI: ``b2g --help``/``--version`` solo pagan
+click y los módulos que el subcomando realmente usa.  ``__dir__`` devuelve
+``__all__`` para que el autocompletado siga funcionando sin disparar imports.
 
 Ver ``docs/API.md`` §1-2, §4-6, §7-10.
 """
 
 from __future__ import annotations
 
-from bib2graph.backends import InMemoryBackend, TabularBackend
-from bib2graph.corpus import Corpus, CorpusSnapshot, Manifest
-from bib2graph.exporters import CsvExporter, GraphMLExporter
-from bib2graph.filters import FilterCriterion, apply_filters
-from bib2graph.foraging import Forager, GrowthPreview, RankedCandidates
-from bib2graph.networks.analyzer import (
-    QualityThresholds,
-    assortativity,
-    centrality,
-    cocitation_quality_report,
-    community_composition,
-    detect_communities,
-    network_metrics,
-)
-from bib2graph.networks.facade import Networks
-from bib2graph.networks.projectors import (
-    AuthorCollaborationProjector,
-    BibliographicCouplingProjector,
-    CoCitationProjector,
-    InstitutionCollaborationProjector,
-    KeywordCoOccurrenceProjector,
-)
-from bib2graph.networks.spec import NetworkArtifact
-from bib2graph.preprocessors import Preprocessor
-from bib2graph.schemas import SchemaError
-from bib2graph.sources import BibtexSource, OpenAlexSource, SeedResult, Source
+import importlib
+from typing import Any
 
 __all__ = [
     "AuthorCollaborationProjector",
@@ -104,19 +78,69 @@ __all__ = [
     "network_metrics",
 ]
 
-# Carga perezosa (PEP 562): ``import bib2graph`` NO arrastra duckdb.
-# Solo ``bib2graph.DuckDBBackend`` / ``bib2graph.DuckDBStore`` lo cargan bajo demanda.
-_LAZY = {
-    "DuckDBBackend": ("bib2graph.backends.duckdb", "DuckDBBackend"),
-    "DuckDBStore": ("bib2graph.stores.duckdb", "DuckDBStore"),
+# Carga perezosa (PEP 562): símbolo público → módulo que lo define.
+# ``import bib2graph`` no arrastra NINGUNA dependencia pesada; cada atributo
+# importa su submódulo en el primer acceso y queda cacheado en globals().
+_LAZY: dict[str, str] = {
+    "AuthorCollaborationProjector": "bib2graph.networks.projectors",
+    "BibliographicCouplingProjector": "bib2graph.networks.projectors",
+    "BibtexSource": "bib2graph.sources",
+    "CoCitationProjector": "bib2graph.networks.projectors",
+    "Corpus": "bib2graph.corpus",
+    "CorpusSnapshot": "bib2graph.corpus",
+    "CsvExporter": "bib2graph.exporters",
+    "DuckDBBackend": "bib2graph.backends.duckdb",
+    "DuckDBStore": "bib2graph.stores.duckdb",
+    "FilterCriterion": "bib2graph.filters",
+    "Forager": "bib2graph.foraging",
+    "GraphMLExporter": "bib2graph.exporters",
+    "GrowthPreview": "bib2graph.foraging",
+    "InMemoryBackend": "bib2graph.backends",
+    "InstitutionCollaborationProjector": "bib2graph.networks.projectors",
+    "KeywordCoOccurrenceProjector": "bib2graph.networks.projectors",
+    "Manifest": "bib2graph.corpus",
+    "NetworkArtifact": "bib2graph.networks.spec",
+    "Networks": "bib2graph.networks.facade",
+    "OpenAlexSource": "bib2graph.sources",
+    "Preprocessor": "bib2graph.preprocessors",
+    "QualityThresholds": "bib2graph.networks.analyzer",
+    "RankedCandidates": "bib2graph.foraging",
+    "SchemaError": "bib2graph.schemas",
+    "SeedResult": "bib2graph.sources",
+    "Source": "bib2graph.sources",
+    "TabularBackend": "bib2graph.backends",
+    "apply_filters": "bib2graph.filters",
+    "assortativity": "bib2graph.networks.analyzer",
+    "centrality": "bib2graph.networks.analyzer",
+    "cocitation_quality_report": "bib2graph.networks.analyzer",
+    "community_composition": "bib2graph.networks.analyzer",
+    "detect_communities": "bib2graph.networks.analyzer",
+    "network_metrics": "bib2graph.networks.analyzer",
 }
 
 
-def __getattr__(name: str) -> object:
-    if name in _LAZY:
-        module_name, attr = _LAZY[name]
-        import importlib
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        # Fuente única: la metadata de packaging (pyproject.toml).  Un literal
+        # hardcodeado acá driftearía en cada release manejada por release-please.
+        # Resolución perezosa: el stat de metadata se paga solo si alguien lo pide.
+        from importlib.metadata import PackageNotFoundError, version
 
-        mod = importlib.import_module(module_name)
-        return getattr(mod, attr)
+        try:
+            v = version("bib2graph")
+        except PackageNotFoundError:  # árbol sin instalar (p. ej. checkout crudo)
+            v = "0+unknown"
+        globals()["__version__"] = v
+        return v
+    if name in _LAZY:
+        mod = importlib.import_module(_LAZY[name])
+        val = getattr(mod, name)
+        # Cachear en el dict del paquete: el próximo acceso no pasa por acá.
+        globals()[name] = val
+        return val
     raise AttributeError(f"module 'bib2graph' has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Autocompletado/introspección sin disparar los imports perezosos."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,15 @@
+"""__main__ — soporte para ``python -m bib2graph``.
+
+Equivale al entry point ``b2g``: delega en ``bib2graph._entry.entry``, que
+resuelve ``--version``/``-V`` por la vía stdlib antes de importar
+``bib2graph.cli`` (ver el docstring de ``_entry``).
+"""
+
+from __future__ import annotations
+
+import sys
+
+from bib2graph._entry import entry
+
+if __name__ == "__main__":
+    sys.exit(entry())
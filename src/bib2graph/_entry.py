@@ -0,0 +1,37 @@
+"""_entry — entry point liviano del console script ``b2g``.
+
+Camino compartido por ``b2g`` (pyproject ``[project.scripts]``) y por
+``python -m bib2graph`` (``__main__.py``): resuelve ``--version``/``-V``
+con ``importlib.metadata`` ANTES de importar ``bib2graph.cli``, que es lo
+caro (click + los 12 comandos registrados).  El ``__init__`` del paquete es
+perezoso (PEP 562), así que este módulo solo paga stdlib en el fast path.
+
+Vive DENTRO del paquete (no como módulo top-level aparte): el repo es un
+solo paquete con src layout y el único entry point público es ``b2g``
+(ADR 0038, #207).
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+def entry() -> int:
+    """Fast path de ``--version``/``-V``; el resto delega en ``bib2graph.cli``.
+
+    Returns:
+        Exit code del proceso (0 éxito, 1-5 error según ADR 0010).
+    """
+    if sys.argv[1:2] in (["--version"], ["-V"]):
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            v = version("bib2graph")
+        except PackageNotFoundError:  # árbol sin instalar (p. ej. checkout crudo)
+            v = "0+unknown"
+        print(f"b2g, version {v}")
+        return 0
+
+    from bib2graph.cli import main as cli_main
+
+    return cli_main()
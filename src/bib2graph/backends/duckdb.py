@@ -162,6 +162,38 @@ _DDL_CORPUS_BACKFILL_SEQ = """
 UPDATE corpus SET _seq = rowid WHERE _seq IS NULL
 """
 
+# Índices secundarios sobre las claves de lookup naturales del corpus.
+# ``id`` ya es PRIMARY KEY (índice ART implícito); ``doi`` y ``source_id``
+# son las otras dos identidades por las que se resuelven papers (ADR 0036).
+# Sin índice, cada lookup SQL por esas columnas es un full scan de la tabla.
+# Se crean una sola vez en ``_setup`` (IF NOT EXISTS = no-op en reaperturas).
+_DDL_CORPUS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_corpus_doi ON corpus (doi)",
+    "CREATE INDEX IF NOT EXISTS idx_corpus_source_id ON corpus (source_id)",
+)
+
+# Queries recurrentes de los métodos calientes, como constantes de módulo
+# (misma convención que ``_UPSERT_SQL``): una sola asignación del string por
+# proceso y una única definición para las consultas que aparecen en más de
+# un método (``MAX(_seq)`` en add_paper/persist, external_ids en _clone y
+# all_external_ids).
+_SQL_MAX_SEQ = "SELECT COALESCE(MAX(_seq), 0) FROM corpus"
+_SQL_COUNT_CORPUS = "SELECT COUNT(*) FROM corpus"
+_SQL_LAST_LOOP_STATE = (
+    "SELECT state FROM loop_state_log ORDER BY recorded_at DESC LIMIT 1"
+)
+_SQL_LAST_LOOP_ROUND = (
+    "SELECT round FROM loop_state_log ORDER BY recorded_at DESC LIMIT 1"
+)
+_SQL_INSERT_LOOP_STATE = "INSERT INTO loop_state_log (state, round) VALUES (?, ?)"
+_SQL_ALL_EXTERNAL_IDS = "SELECT paper_id, engine, id FROM external_ids"
+_SQL_REF_IDS_ORDERED = (
+    "SELECT ref_id FROM referenced_but_not_fetched ORDER BY observed_at"
+)
+_SQL_INSERT_REF_NOT_FETCHED = (
+    "INSERT INTO referenced_but_not_fetched (ref_id, cycle_round) VALUES (?, ?)"
+)
+
 # SQL de UPSERT
 # ADR 0024: ``_seq`` se incluye en el INSERT pero NO en el DO UPDATE SET,
 # de modo que filas existentes conservan su ``_seq`` original (primera aparición).
@@ -472,6 +504,8 @@ class DuckDBBackend:
             self._con.execute(
                 "ALTER TABLE corpus RENAME COLUMN openalex_id TO source_id"
             )
+        for ddl_index in _DDL_CORPUS_INDEXES:
+            self._con.execute(ddl_index)
         self._con.execute(_DDL_REFERENCED_BUT_NOT_FETCHED)
         self._con.execute(_DDL_EXTERNAL_IDS)
         self._con.execute(_DDL_FILTER_LOG)
@@ -555,9 +589,7 @@ class DuckDBBackend:
             return
         table = _dedup_merge_table(table)
         # ADR 0024: base para el _seq monótono de las filas nuevas en este lote
-        result = self._con.execute(
-            "SELECT COALESCE(MAX(_seq), 0) FROM corpus"
-        ).fetchone()
+        result = self._con.execute(_SQL_MAX_SEQ).fetchone()
         start: int = int(result[0]) if result else 0
         table_with_idx = table.append_column(
             "_row_idx",
@@ -588,59 +620,65 @@ class DuckDBBackend:
             new_backend._setup()
             if len(current_table) > 0:
                 new_backend._upsert_table(current_table)
+            # Copia de tablas auxiliares con executemany: un solo statement
+            # preparado por tabla en vez de un round-trip execute por fila.
             log_rows = self._con.execute(
                 "SELECT state, round, recorded_at FROM loop_state_log ORDER BY recorded_at"
             ).fetchall()
-            for state_val, round_val, at_val in log_rows:
-                new_backend._con.execute(
+            if log_rows:
+                new_backend._con.executemany(
                     "INSERT INTO loop_state_log (state, round, recorded_at) VALUES (?, ?, ?)",
-                    [state_val, round_val, at_val],
+                    log_rows,
                 )
             ref_rows = self._con.execute(
                 "SELECT ref_id, cycle_round, observed_at "
                 "FROM referenced_but_not_fetched ORDER BY observed_at"
             ).fetchall()
-            for ref_id_val, cycle_round_val, observed_at_val in ref_rows:
-                new_backend._con.execute(
+            if ref_rows:
+                new_backend._con.executemany(
                     "INSERT INTO referenced_but_not_fetched "
                     "(ref_id, cycle_round, observed_at) VALUES (?, ?, ?)",
-                    [ref_id_val, cycle_round_val, observed_at_val],
+                    ref_rows,
                 )
-            ext_rows = self._con.execute(
-                "SELECT paper_id, engine, id FROM external_ids"
-            ).fetchall()
-            for paper_id_val, engine_val, id_val in ext_rows:
-                new_backend._con.execute(
+            ext_rows = self._con.execute(_SQL_ALL_EXTERNAL_IDS).fetchall()
+            if ext_rows:
+                new_backend._con.executemany(
                     "INSERT OR REPLACE INTO external_ids (paper_id, engine, id) "
                     "VALUES (?, ?, ?)",
-                    [paper_id_val, engine_val, id_val],
+                    ext_rows,
                 )
             filter_rows = self._con.execute(
                 "SELECT name, criteria, count_before, count_after, recorded_at "
                 "FROM filter_log ORDER BY recorded_at"
             ).fetchall()
-            for name_val, criteria_val, cb_val, ca_val, at_val in filter_rows:
-                new_backend._con.execute(
+            if filter_rows:
+                new_backend._con.executemany(
                     "INSERT INTO filter_log "
                     "(name, criteria, count_before, count_after, recorded_at) "
                     "VALUES (?, ?, ?, ?, ?)",
-                    [name_val, criteria_val, cb_val, ca_val, at_val],
+                    filter_rows,
                 )
             enricher_rows = self._con.execute(
                 "SELECT name, params_json, recorded_at "
                 "FROM enricher_log ORDER BY recorded_at"
             ).fetchall()
-            for er_name, er_params, er_at in enricher_rows:
-                new_backend._con.execute(
+            if enricher_rows:
+                new_backend._con.executemany(
                     "INSERT INTO enricher_log (name, params_json, recorded_at) "
                     "VALUES (?, ?, ?)",
-                    [er_name, er_params, er_at],
+                    enricher_rows,
                 )
             return new_backend
         else:
             new_backend = DuckDBBackend.__new__(DuckDBBackend)
             new_backend._path = self._path
-            new_backend._con = duckdb.connect(self._path)
+            # cursor() comparte la instancia de base de datos de la conexión
+            # original en vez de re-abrir el archivo: evita el costo de
+            # re-apertura por mutación y no compite por el lock del archivo
+            # (ADR 0019).  _setup() sigue siendo necesario e idempotente: el
+            # catálogo es compartido, así que el DDL y las UDFs ya existentes
+            # se omiten vía IF NOT EXISTS / suppress(CatalogException).
+            new_backend._con = self._con.cursor()
             new_backend._setup()
             return new_backend
 
@@ -673,9 +711,7 @@ class DuckDBBackend:
         """
         new_backend = self._clone()
         # ADR 0024: _seq para la fila nueva = MAX actual + 1
-        result = new_backend._con.execute(
-            "SELECT COALESCE(MAX(_seq), 0) FROM corpus"
-        ).fetchone()
+        result = new_backend._con.execute(_SQL_MAX_SEQ).fetchone()
         seq: int = int(result[0]) + 1 if result else 1
         params = [*_row_to_params(row), seq]
         new_backend._con.execute(_UPSERT_SQL, params)
@@ -744,12 +780,39 @@ class DuckDBBackend:
 
         new_backend = self._clone()
         id_set = set(ids)
-        for row in updated_rows:
-            if str(row.get("id")) in id_set:
-                # ADR 0024: las filas actualizadas ya existen → ON CONFLICT preserva _seq.
-                # Se pasa _seq=0 como placeholder; el DO UPDATE no lo sobrescribe.
-                params = [*_row_to_params(row), 0]
-                new_backend._con.execute(_UPSERT_SQL, params)
+        # La curación solo toca ``curation_status`` y ``provenance``; el resto
+        # de las columnas queda intacto.  Un UPDATE masivo desde una vista
+        # Arrow registrada reemplaza el round-trip por fila previo (O(n) → 1
+        # sentencia SQL por lote) sin pasar por las UDFs de merge: las filas
+        # de ``_apply_curation_to_rows`` ya traen el estado final (la
+        # provenance acumulada incluye los eventos previos, así que el SET
+        # directo es equivalente byte a byte al merge).
+        changed = [
+            row for row in updated_rows if str(row.get("id")) in id_set
+        ]
+        if changed:
+            patch = pa.table(
+                {
+                    "id": pa.array([str(r["id"]) for r in changed], type=pa.string()),
+                    "curation_status": pa.array(
+                        [r.get("curation_status") for r in changed], type=pa.string()
+                    ),
+                    "provenance": pa.array(
+                        [r.get("provenance") for r in changed], type=pa.string()
+                    ),
+                }
+            )
+            new_backend._con.register("_curation_patch", patch)
+            try:
+                new_backend._con.execute(
+                    "UPDATE corpus SET\n"
+                    "    curation_status = src.curation_status,\n"
+                    "    provenance = src.provenance\n"
+                    "FROM _curation_patch AS src\n"
+                    "WHERE corpus.id = src.id"
+                )
+            finally:
+                new_backend._con.unregister("_curation_patch")
         return new_backend
 
     def filter_view(self, view: Literal["seeds", "candidates", "accepted"]) -> pa.Table:
@@ -805,7 +868,7 @@ class DuckDBBackend:
 
     def __len__(self) -> int:
         """Número de papers en el backend."""
-        result = self._con.execute("SELECT COUNT(*) FROM corpus").fetchone()
+        result = self._con.execute(_SQL_COUNT_CORPUS).fetchone()
         return int(result[0]) if result else 0
 
     def __eq__(self, other: object) -> bool:
@@ -824,9 +887,7 @@ class DuckDBBackend:
         Returns:
             El ``CycleState`` actual, o ``None`` si no hay transiciones aún.
         """
-        row = self._con.execute(
-            "SELECT state FROM loop_state_log ORDER BY recorded_at DESC LIMIT 1"
-        ).fetchone()
+        row = self._con.execute(_SQL_LAST_LOOP_STATE).fetchone()
         if row is None:
             return None
         return CycleState(row[0])
@@ -841,9 +902,7 @@ class DuckDBBackend:
         Returns:
             Entero >= 0.  0 = sin estado; 1 = primera ronda; 2+ = re-sembrados.
         """
-        row = self._con.execute(
-            "SELECT round FROM loop_state_log ORDER BY recorded_at DESC LIMIT 1"
-        ).fetchone()
+        row = self._con.execute(_SQL_LAST_LOOP_ROUND).fetchone()
         if row is None or row[0] is None:
             return 0
         return int(row[0])
@@ -869,10 +928,7 @@ class DuckDBBackend:
                 ronda actual del log.
         """
         current_round = self.loop_round() if cycle_round is None else cycle_round
-        self._con.execute(
-            "INSERT INTO loop_state_log (state, round) VALUES (?, ?)",
-            [state.value, current_round],
-        )
+        self._con.execute(_SQL_INSERT_LOOP_STATE, [state.value, current_round])
 
     # Extensiones propias: referenced_but_not_fetched (#54)
 
@@ -899,11 +955,7 @@ class DuckDBBackend:
         existing: set[str] = {r[0] for r in existing_rows}
         new_ids = [rid for rid in ref_ids if rid not in existing]
         for rid in new_ids:
-            self._con.execute(
-                "INSERT INTO referenced_but_not_fetched (ref_id, cycle_round) "
-                "VALUES (?, ?)",
-                [rid, cycle_round],
-            )
+            self._con.execute(_SQL_INSERT_REF_NOT_FETCHED, [rid, cycle_round])
         return len(new_ids)
 
     def referenced_refs_count(self) -> int:
@@ -923,9 +975,7 @@ class DuckDBBackend:
         Returns:
             Lista de ``ref_id`` en orden de inserción.
         """
-        rows = self._con.execute(
-            "SELECT ref_id FROM referenced_but_not_fetched ORDER BY observed_at"
-        ).fetchall()
+        rows = self._con.execute(_SQL_REF_IDS_ORDERED).fetchall()
         return [r[0] for r in rows]
 
     # Extensiones propias: external_ids (ADR 0036 opción C)
@@ -973,9 +1023,7 @@ class DuckDBBackend:
         Returns:
             Lista de tuplas ``(paper_id, engine, id)`` en orden no definido.
         """
-        rows = self._con.execute(
-            "SELECT paper_id, engine, id FROM external_ids"
-        ).fetchall()
+        rows = self._con.execute(_SQL_ALL_EXTERNAL_IDS).fetchall()
         return [(r[0], r[1], r[2]) for r in rows]
 
     # Extensiones propias: filter_log (#126)
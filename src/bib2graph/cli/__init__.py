@@ -96,7 +96,9 @@ def _force_utf8() -> None:
 
 
 @click.group()
-@click.version_option(package_name="bib2graph")
+# ``-V`` se registra también acá (no solo en el fast path de ``_entry``) para
+# que funcione en cualquier posición: ``b2g --workspace x -V`` no es error de uso.
+@click.version_option(None, "--version", "-V", package_name="bib2graph")
 @click.option(
     "--workspace",
     default=None,
@@ -142,6 +142,10 @@ def _write_artifacts(
     exporter = GraphMLExporter()
     networks_info: list[dict[str, Any]] = []
 
+    # Invariante del loop: la tabla Arrow es la misma para todos los
+    # artefactos — exportarla una vez, no una vez por red.
+    corpus_table = corpus.to_arrow()
+
     for art in artifacts:
         kind = art.spec.kind
         kind_dir = artifacts_dir / kind
@@ -179,7 +183,7 @@ def _write_artifacts(
 
         # cluster_table devuelve [] si el kind no es de paper o no hay comunidades.
         clusters_path: str | None = None
-        clusters = cluster_table(corpus.to_arrow(), art)
+        clusters = cluster_table(corpus_table, art)
         if clusters:
             clusters_path = str(kind_dir / "clusters.csv")
             with open(clusters_path, "w", newline="", encoding="utf-8") as _f:
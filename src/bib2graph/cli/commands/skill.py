@@ -58,7 +58,7 @@ from bib2graph.cli._options import json_mode, json_option
 # Provider-como-dato (ADR 0046)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Provider:
     """Un cliente de agentes soportado por ``skill add``.
 
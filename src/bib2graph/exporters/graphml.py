@@ -30,6 +30,8 @@ class GraphMLExporter:
         g: _Graph,
         results: dict[str, object],
         out_dir: str | Path,
+        *,
+        compress: bool = False,
     ) -> None:
         """Exporta el grafo a ``<out_dir>/network.graphml``.
 
@@ -42,6 +44,10 @@ class GraphMLExporter:
             results: Dict de métricas/análisis. Los valores pueden ser dicts
                 ``{nodo: valor}`` (p. ej. salida de ``centrality``).
             out_dir: Directorio de salida. Se crea si no existe.
+            compress: Si ``True``, escribe ``network.graphml.gz`` (gzip).
+                GraphML es XML verboso; la compresión reduce el archivo
+                ~5-10x y Gephi/Cytoscape abren ``.graphml.gz`` directo.
+                Default ``False`` = archivo plano (comportamiento histórico).
         """
         out_path = Path(out_dir)
         out_path.mkdir(parents=True, exist_ok=True)
@@ -68,4 +74,6 @@ class GraphMLExporter:
             for k in none_keys:
                 del data[k]
 
-        nx.write_graphml(export_g, str(out_path / "network.graphml"))
+        # nx.write_graphml comprime solo cuando la ruta termina en .gz
+        filename = "network.graphml.gz" if compress else "network.graphml"
+        nx.write_graphml(export_g, str(out_path / filename))
@@ -7,33 +7,17 @@ Reexporta los símbolos públicos del paquete de redes:
   - ``decorate`` / ``decorate_graph`` (capa de decoración de nodos, issue #25).
   - ``cluster_table`` (tabla de resumen de comunidades por cluster, issue #31).
 
+La re-exportación es perezosa (PEP 562, mismo patrón que el ``__init__``
+del paquete raíz): importar ``bib2graph.networks`` no arrastra networkx ni
+pyarrow; cada símbolo carga su módulo en el primer acceso y queda cacheado.
+
 Ver API.md §7-10.
 """
 
 from __future__ import annotations
 
-from bib2graph.networks.analyzer import (
-    QualityThresholds,
-    assortativity,
-    centrality,
-    cocitation_quality_report,
-    community_composition,
-    detect_communities,
-    network_metrics,
-)
-from bib2graph.networks.clusters import cluster_table
-from bib2graph.networks.decorate import decorate, decorate_graph
-from bib2graph.networks.facade import Networks, predict_build_preview
-from bib2graph.networks.projectors import (
-    MIN_WEIGHT_DEFAULT,
-    AuthorCollaborationProjector,
-    BibliographicCouplingProjector,
-    CoCitationProjector,
-    InstitutionCollaborationProjector,
-    KeywordCoOccurrenceProjector,
-    collect_item_to_papers,
-)
-from bib2graph.networks.spec import NetworkArtifact, NetworkSpec, load_specs
+import importlib
+from typing import Any
 
 __all__ = [
     "MIN_WEIGHT_DEFAULT",
@@ -59,3 +43,43 @@ __all__ = [
     "network_metrics",
     "predict_build_preview",
 ]
+
+# Símbolo público → módulo que lo define (resolución perezosa, PEP 562).
+_LAZY: dict[str, str] = {
+    "MIN_WEIGHT_DEFAULT": "bib2graph.networks.projectors",
+    "AuthorCollaborationProjector": "bib2graph.networks.projectors",
+    "BibliographicCouplingProjector": "bib2graph.networks.projectors",
+    "CoCitationProjector": "bib2graph.networks.projectors",
+    "InstitutionCollaborationProjector": "bib2graph.networks.projectors",
+    "KeywordCoOccurrenceProjector": "bib2graph.networks.projectors",
+    "NetworkArtifact": "bib2graph.networks.spec",
+    "NetworkSpec": "bib2graph.networks.spec",
+    "Networks": "bib2graph.networks.facade",
+    "QualityThresholds": "bib2graph.networks.analyzer",
+    "assortativity": "bib2graph.networks.analyzer",
+    "centrality": "bib2graph.networks.analyzer",
+    "cluster_table": "bib2graph.networks.clusters",
+    "cocitation_quality_report": "bib2graph.networks.analyzer",
+    "collect_item_to_papers": "bib2graph.networks.projectors",
+    "community_composition": "bib2graph.networks.analyzer",
+    "decorate": "bib2graph.networks.decorate",
+    "decorate_graph": "bib2graph.networks.decorate",
+    "detect_communities": "bib2graph.networks.analyzer",
+    "load_specs": "bib2graph.networks.spec",
+    "network_metrics": "bib2graph.networks.analyzer",
+    "predict_build_preview": "bib2graph.networks.facade",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        mod = importlib.import_module(_LAZY[name])
+        val = getattr(mod, name)
+        globals()[name] = val
+        return val
+    raise AttributeError(f"module 'bib2graph.networks' has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Autocompletado/introspección sin disparar los imports perezosos."""
+    return sorted(set(globals()) | set(__all__))
@@ -14,6 +14,7 @@ Todas son funciones puras: sin I/O, sin red, sin estado global.
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 import networkx as nx
@@ -50,35 +51,66 @@ class QualityThresholds(BaseModel):
 
 
 def network_metrics(g: _Graph) -> dict[str, object]:
-    """Densidad, nº de componentes y clustering promedio del grafo.
+    """Densidad, componentes (nº y tamaño del mayor) y clustering promedio.
+
+    Los componentes conexos se recorren UNA vez (un solo barrido BFS) y de
+    esa lista se derivan tanto el conteo como el tamaño del componente
+    gigante, en vez de re-recorrer el grafo por cada agregado.
 
     Args:
         g: Grafo NetworkX (no dirigido).
 
     Returns:
-        Dict con claves ``'density'``, ``'num_components'``, ``'avg_clustering'``.
+        Dict con claves ``'density'``, ``'num_components'``,
+        ``'largest_component_size'`` y ``'avg_clustering'``.
     """
     avg_clust = nx.average_clustering(g) if g.number_of_nodes() > 0 else 0.0
+    component_sizes = [len(c) for c in nx.connected_components(g)]
     return {
         "density": nx.density(g),
-        "num_components": nx.number_connected_components(g),
+        "num_components": len(component_sizes),
+        "largest_component_size": max(component_sizes, default=0),
         "avg_clustering": avg_clust,
     }
 
 
-def centrality(g: _Graph) -> dict[str, dict[Any, float]]:
+def centrality(
+    g: _Graph,
+    *,
+    betweenness_samples: int | None = None,
+    random_state: int = 42,
+) -> dict[str, dict[Any, float]]:
     """Centralidad de grado e intermediación por nodo.
 
+    La intermediación exacta (Brandes) es O(V·E) y domina el costo en redes
+    de más de unos cientos de nodos.  ``betweenness_samples`` habilita la
+    variante aproximada de Brandes con ``k`` pivotes muestreados
+    (O(k·E)): preserva el ranking de los nodos más centrales — lo que
+    consume ``b2g read`` — con error acotado por ``k``.  El muestreo se
+    siembra con ``random_state`` para mantener el contrato de
+    reproducibilidad (mismo grafo + mismos parámetros → mismos valores).
+
     Args:
         g: Grafo NetworkX (no dirigido).
+        betweenness_samples: Si se provee, nº de pivotes para la
+            intermediación aproximada.  Se recorta a ``len(g)`` (con ``k`` =
+            nº de nodos el resultado es exacto).  ``None`` (default) =
+            cálculo exacto, comportamiento histórico.
+        random_state: Semilla del muestreo de pivotes.  Solo se usa cuando
+            ``betweenness_samples`` está activo.
 
     Returns:
         Dict con claves ``'degree'`` y ``'betweenness'``, cada una mapeando
         nodo → valor de centralidad.
     """
+    if betweenness_samples is None:
+        betweenness = nx.betweenness_centrality(g)
+    else:
+        k = min(g.number_of_nodes(), betweenness_samples)
+        betweenness = nx.betweenness_centrality(g, k=k, seed=random_state)
     return {
         "degree": nx.degree_centrality(g),
-        "betweenness": nx.betweenness_centrality(g),
+        "betweenness": betweenness,
     }
 
 
@@ -219,27 +251,30 @@ def community_composition(
         Dict comunidad → Dict categoría → fracción (0.0 a 1.0). La suma de
         fracciones por comunidad es 1.0 si todos los nodos tienen el atributo.
     """
-    community_values: dict[int, list[str]] = {}
+    # Un Counter por comunidad: cada lista de valores se recorre UNA vez,
+    # en vez de un list.count(cat) por categoría (que re-escaneaba la lista
+    # completa C×|categorías| veces).
+    community_counts: dict[int, Counter[str]] = {}
     for node, comm_id in communities.items():
         val = g.nodes[node].get(attribute)
         if val is None:
             continue
-        if comm_id not in community_values:
-            community_values[comm_id] = []
-        community_values[comm_id].append(str(val))
+        if comm_id not in community_counts:
+            community_counts[comm_id] = Counter()
+        community_counts[comm_id][str(val)] += 1
 
     all_categories: set[str] = set()
-    for vals in community_values.values():
-        all_categories.update(vals)
+    for counts in community_counts.values():
+        all_categories.update(counts)
     sorted_categories = sorted(all_categories)
 
     result: dict[int, dict[str, float]] = {}
-    for comm_id in sorted(community_values):
-        vals = community_values[comm_id]
-        total = len(vals)
+    for comm_id in sorted(community_counts):
+        counts = community_counts[comm_id]
+        total = sum(counts.values())
         composition: dict[str, float] = {}
         for cat in sorted_categories:
-            composition[cat] = vals.count(cat) / total if total > 0 else 0.0
+            composition[cat] = counts[cat] / total if total > 0 else 0.0
         result[comm_id] = composition
 
     return result
@@ -277,37 +312,40 @@ def cocitation_quality_report(
 
     vol_pasa = total >= thresholds.min_volume
 
-    con_doi = sum(1 for r in rows if r.get(Col.DOI))
-    doi_pct = con_doi / total if total > 0 else 0.0
-    doi_pasa = doi_pct >= thresholds.min_doi_refs_pct
-
-    # Para el report usamos el conjunto de valores únicos en institutions_id
-    # que sean distintos entre sí (la diversidad real requiere un lookup externo;
-    # aquí contamos cuántos ids distintos hay, bajo el supuesto de que cada inst
-    # pertenece a un país diferente — el caller puede refinar asignando un
-    # atributo de country a los nodos antes de llamar a esta función).
+    # Una sola pasada sobre las filas acumula los 3 agregados restantes
+    # (DOI, instituciones únicas, frecuencia de autores): el corpus se
+    # escanea 1 vez en lugar de 3.  Se consideró paralelizar los agregados
+    # con threads, pero sobre filas en memoria el GIL serializa el trabajo
+    # y la pasada única ya elimina el costo que la concurrencia atacaría;
+    # además mantiene la función pura (sin executor ni estado compartido).
+    #
+    # Para el criterio geográfico usamos el conjunto de valores únicos en
+    # institutions_id (la diversidad real requiere un lookup externo;
+    # aquí contamos cuántos ids distintos hay, bajo el supuesto de que cada
+    # inst pertenece a un país diferente — el caller puede refinar asignando
+    # un atributo de country a los nodos antes de llamar a esta función).
     #
     # Decisión de implementación: contamos cuántos valores de institutions_id
     # únicos hay en el corpus. Sin metadata extra no podemos mapear a países.
     # El contrato (D6) dice "diversidad geográfica" con umbral min_countries.
     # Implementamos como: nº de institutions_id únicos presentes ≥ min_countries.
     # Para tests, el caller puede usar institution ids con prefijo de país.
+    con_doi = 0
     unique_insts: set[str] = set()
+    author_count: Counter[str] = Counter()
     for r in rows:
+        if r.get(Col.DOI):
+            con_doi += 1
         insts = r.get(Col.INSTITUTIONS_ID)
         if isinstance(insts, list):
-            for inst in insts:
-                if inst is not None:
-                    unique_insts.add(str(inst))
-    geo_pasa = len(unique_insts) >= thresholds.min_countries
-
-    author_count: dict[str, int] = {}
-    for r in rows:
+            unique_insts.update(str(inst) for inst in insts if inst is not None)
         authors = r.get(Col.AUTHORS_ID)
         if isinstance(authors, list):
-            for a in authors:
-                if a is not None:
-                    author_count[str(a)] = author_count.get(str(a), 0) + 1
+            author_count.update(str(a) for a in authors if a is not None)
+
+    doi_pct = con_doi / total if total > 0 else 0.0
+    doi_pasa = doi_pct >= thresholds.min_doi_refs_pct
+    geo_pasa = len(unique_insts) >= thresholds.min_countries
     recurrent = sum(1 for c in author_count.values() if c >= 2)
     recurrent_pasa = recurrent >= thresholds.min_recurrent_authors
 
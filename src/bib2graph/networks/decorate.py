@@ -265,74 +265,100 @@ def decorate_graph(
     # Centralidad de grado (una sola llamada, determinista)
     deg_centrality: dict[Any, float] = nx.degree_centrality(graph)
 
+    # Los atributos se acumulan en un dict-de-dicts {nodo: {attr: valor}} y se
+    # escriben con UN solo set_node_attributes por grafo: un update() por nodo
+    # en vez de un acceso graph.nodes[node][attr] por atributo.
+    attrs_by_node: dict[Any, dict[str, object]] = {}
+
     if kind in _PAPER_KINDS:
         paper_index = _build_paper_index(table)
         for node in graph.nodes():
             key = str(node)
             info = paper_index.get(key, {})
-            graph.nodes[node]["label"] = str(info.get("label", key))
-            graph.nodes[node]["degree_centrality"] = deg_centrality.get(node, 0.0)
+            attrs: dict[str, object] = {
+                "label": str(info.get("label", key)),
+                "degree_centrality": deg_centrality.get(node, 0.0),
+            }
             year = info.get("year")
             if isinstance(year, int):
-                graph.nodes[node]["year"] = year
+                attrs["year"] = year
             is_seed = info.get("is_seed")
             if isinstance(is_seed, bool):
-                graph.nodes[node]["is_seed"] = is_seed
+                attrs["is_seed"] = is_seed
             curation = info.get("curation_status")
             if curation is not None:
-                graph.nodes[node]["curation_status"] = str(curation)
+                attrs["curation_status"] = str(curation)
             doi_val = info.get("doi")
             doi_str = doi_val if isinstance(doi_val, str) else None
             if doi_str is not None:
-                graph.nodes[node]["doi"] = doi_str
+                attrs["doi"] = doi_str
             source_id_val = info.get("source_id")
             source_id_str = source_id_val if isinstance(source_id_val, str) else None
             url = resolve_paper_url(doi_str, source_id_str)
             if url is not None:
-                graph.nodes[node]["url"] = url
+                attrs["url"] = url
             venue = info.get("venue")
             if venue is not None:
-                graph.nodes[node]["venue"] = str(venue)
+                attrs["venue"] = str(venue)
             authors = info.get("authors")
             if authors is not None:
-                graph.nodes[node]["authors"] = str(authors)
+                attrs["authors"] = str(authors)
             keywords = info.get("keywords")
             if keywords is not None:
-                graph.nodes[node]["keywords"] = str(keywords)
+                attrs["keywords"] = str(keywords)
             cited_by_count = info.get("cited_by_count")
             if isinstance(cited_by_count, int):
-                graph.nodes[node]["cited_by_count"] = cited_by_count
+                attrs["cited_by_count"] = cited_by_count
+            attrs_by_node[node] = attrs
 
     elif kind == NetworkKind.AUTHOR_COLLAB:
         author_index = _build_author_index(table)
         for node in graph.nodes():
             key = str(node)
-            graph.nodes[node]["label"] = author_index.get(key, key)
-            graph.nodes[node]["degree_centrality"] = deg_centrality.get(node, 0.0)
+            attrs_by_node[node] = {
+                "label": author_index.get(key, key),
+                "degree_centrality": deg_centrality.get(node, 0.0),
+            }
 
     elif kind == NetworkKind.INSTITUTION_COLLAB:
         inst_index = _build_institution_index(table)
         for node in graph.nodes():
             key = str(node)
-            graph.nodes[node]["label"] = inst_index.get(key, key)
-            graph.nodes[node]["degree_centrality"] = deg_centrality.get(node, 0.0)
+            attrs_by_node[node] = {
+                "label": inst_index.get(key, key),
+                "degree_centrality": deg_centrality.get(node, 0.0),
+            }
 
     elif kind == NetworkKind.KEYWORD_COOCCURRENCE:
         # La keyword normalizada ya es legible; se usa directamente como label.
         for node in graph.nodes():
-            graph.nodes[node]["label"] = str(node)
-            graph.nodes[node]["degree_centrality"] = deg_centrality.get(node, 0.0)
+            attrs_by_node[node] = {
+                "label": str(node),
+                "degree_centrality": deg_centrality.get(node, 0.0),
+            }
 
     else:
         # Kind desconocido: fallback al id crudo (no fallar; es extensible)
         for node in graph.nodes():
-            graph.nodes[node]["label"] = str(node)
-            graph.nodes[node]["degree_centrality"] = deg_centrality.get(node, 0.0)
+            attrs_by_node[node] = {
+                "label": str(node),
+                "degree_centrality": deg_centrality.get(node, 0.0),
+            }
+
+    nx.set_node_attributes(graph, attrs_by_node)
 
     if communities is not None:
-        for node, comm_id in communities.items():
-            if graph.has_node(node):
-                graph.nodes[node]["community"] = int(comm_id)
+        # Escritura en lote: un solo set_node_attributes en vez de un
+        # acceso graph.nodes[node][...] por nodo.
+        nx.set_node_attributes(
+            graph,
+            {
+                node: int(comm_id)
+                for node, comm_id in communities.items()
+                if graph.has_node(node)
+            },
+            "community",
+        )
 
 
 def decorate(artifact: NetworkArtifact, table: pa.Table) -> None:
@@ -54,21 +54,31 @@ _QUICK_KINDS: list[str] = [
     NetworkKind.KEYWORD_COOCCURRENCE,
 ]
 
+# Tabla de despacho kind → clase de proyector (fuente única, computada una vez).
+# Reemplaza la cadena if/elif de ``_projector_for_kind``: agregar un kind nuevo
+# es una entrada acá, no una rama más.
+_PROJECTOR_CLASSES: dict[NetworkKind, type[Projector]] = {
+    NetworkKind.BIBLIOGRAPHIC_COUPLING: BibliographicCouplingProjector,
+    NetworkKind.AUTHOR_COLLAB: AuthorCollaborationProjector,
+    NetworkKind.INSTITUTION_COLLAB: InstitutionCollaborationProjector,
+    NetworkKind.KEYWORD_COOCCURRENCE: KeywordCoOccurrenceProjector,
+    NetworkKind.COCITATION: CoCitationProjector,
+}
 
-def _has_cited_by_data(corpus: Corpus) -> bool:
-    """Devuelve ``True`` si algún paper del corpus tiene ``cited_by_id`` no vacío.
+
+def _has_cited_by_data(table: pa.Table) -> bool:
+    """Devuelve ``True`` si algún paper de la tabla tiene ``cited_by_id`` no vacío.
 
     Se usa para decidir si incluir la red de co-citación en ``Networks.quick``
     (Hito 8b): si la columna está vacía en todo el corpus, la co-citación
     produciría 0 nodos/aristas y se omite silenciosamente.
 
     Args:
-        corpus: Corpus a inspeccionar.
+        table: Tabla Arrow canónica del Corpus (``corpus.to_arrow()``).
 
     Returns:
         ``True`` si al menos un paper tiene ``cited_by_id`` con ≥1 elemento.
     """
-    table = corpus.to_arrow()
     col = table.column("cited_by_id")
     return any(val for val in col.to_pylist())
 
@@ -97,7 +107,8 @@ def _projector_for_kind(spec: NetworkSpec) -> Projector:
     """Devuelve la instancia del proyector correspondiente al ``spec.kind``.
 
     R5: compara con ``NetworkKind`` (fuente única, ADR 0023) en vez de
-    string-literals.
+    string-literals.  El despacho sale de ``_PROJECTOR_CLASSES`` (una tabla
+    de módulo) en lugar de una cadena if/elif por kind.
 
     Args:
         spec: Especificación de la red.
@@ -108,19 +119,10 @@ def _projector_for_kind(spec: NetworkSpec) -> Projector:
     Raises:
         ValueError: Si el kind no es reconocido.
     """
-    kind = spec.kind
-    if kind == NetworkKind.BIBLIOGRAPHIC_COUPLING:
-        return BibliographicCouplingProjector()
-    elif kind == NetworkKind.AUTHOR_COLLAB:
-        return AuthorCollaborationProjector()
-    elif kind == NetworkKind.INSTITUTION_COLLAB:
-        return InstitutionCollaborationProjector()
-    elif kind == NetworkKind.KEYWORD_COOCCURRENCE:
-        return KeywordCoOccurrenceProjector()
-    elif kind == NetworkKind.COCITATION:
-        return CoCitationProjector()
-    else:
-        raise ValueError(f"Kind de red no reconocido: '{kind}'")
+    projector_cls = _PROJECTOR_CLASSES.get(spec.kind)
+    if projector_cls is None:
+        raise ValueError(f"Kind de red no reconocido: '{spec.kind}'")
+    return projector_cls()
 
 
 def _apply_keyword_filter(table: pa.Table, terms: list[str]) -> pa.Table:
@@ -148,10 +150,11 @@ def _apply_keyword_filter(table: pa.Table, terms: list[str]) -> pa.Table:
         if not kws:  # None o lista vacía → no matchea
             mask.append(False)
             continue
-        # ANY: un término matchea cualquier keyword del paper
-        matched = any(
-            term in kw.lower() for kw in kws if kw is not None for term in terms_lower
-        )
+        # ANY: un término matchea cualquier keyword del paper.
+        # Se baja a minúsculas cada keyword UNA vez (antes, el generador
+        # anidado recomputaba kw.lower() por cada par keyword×término).
+        kws_lower = [kw.lower() for kw in kws if kw is not None]
+        matched = any(term in kw for kw in kws_lower for term in terms_lower)
         mask.append(matched)
 
     bool_array = pa.array(mask, type=pa.bool_())
@@ -208,7 +211,13 @@ def _inject_scalar_attribute(
     return injected
 
 
-def _build_artifact(corpus: Corpus, spec: NetworkSpec) -> NetworkArtifact:
+def _build_artifact(
+    corpus: Corpus,
+    spec: NetworkSpec,
+    *,
+    table: pa.Table | None = None,
+    corpus_hash: str | None = None,
+) -> NetworkArtifact:
     """Construye un ``NetworkArtifact`` a partir de un corpus y una spec.
 
     Proyecta, calcula métricas y detecta comunidades (si spec.clustering está
@@ -226,12 +235,20 @@ def _build_artifact(corpus: Corpus, spec: NetworkSpec) -> NetworkArtifact:
     Args:
         corpus: Corpus de origen.
         spec: Especificación de la red.
+        table: Tabla Arrow ya materializada del corpus.  ``Networks.quick``
+            la pasa para exportar el corpus UNA vez por lote en vez de una
+            vez por spec.  ``None`` (default) = exportar acá.
+        corpus_hash: Hash de contenido ya calculado del corpus (memoización
+            por lote: el hash es función pura del corpus y ``quick`` lo
+            computa una vez para todas las specs).  ``None`` (default) =
+            calcular acá si la spec usa Louvain.
 
     Returns:
         ``NetworkArtifact`` con grafo, métricas, comunidades y spec.
     """
     projector = _projector_for_kind(spec)
-    table = corpus.to_arrow()
+    if table is None:
+        table = corpus.to_arrow()
 
     if spec.keyword_filter:
         table = _apply_keyword_filter(table, spec.keyword_filter)
@@ -250,7 +267,8 @@ def _build_artifact(corpus: Corpus, spec: NetworkSpec) -> NetworkArtifact:
             # R2: derivar random_state del content-hash para Louvain reproducible
             random_state: int | None = None
             if spec.clustering == "louvain":
-                corpus_hash = corpus._backend.corpus_hash()
+                if corpus_hash is None:
+                    corpus_hash = corpus._backend.corpus_hash()
                 random_state = _louvain_seed_from_hash(corpus_hash)
             communities = detect_communities(
                 g,
@@ -344,6 +362,35 @@ def _count_rows_with_col(
     return count
 
 
+def _count_rows_with_cols(
+    rows: list[dict[str, object]],
+    specs: list[tuple[str, bool]],
+) -> dict[tuple[str, bool], int]:
+    """Versión fusionada de ``_count_rows_with_col`` para varias columnas.
+
+    Acumula todos los conteos en UNA pasada sobre ``rows`` en vez de una
+    pasada completa por columna (``predict_build_preview`` necesita 6).
+    Mismo criterio por conteo que ``_count_rows_with_col``.
+
+    Args:
+        rows: Filas del corpus como dicts (salida de ``table.to_pylist()``).
+        specs: Lista de ``(col, seeds_only)`` a contar.
+
+    Returns:
+        Dict ``{(col, seeds_only): conteo}`` con una entrada por spec.
+    """
+    counts: dict[tuple[str, bool], int] = {spec: 0 for spec in specs}
+    for row in rows:
+        is_seed = bool(row.get(Col.IS_SEED))
+        for col, seeds_only in specs:
+            if seeds_only and not is_seed:
+                continue
+            val = row.get(col)
+            if isinstance(val, list) and any(e is not None for e in val):
+                counts[(col, seeds_only)] += 1
+    return counts
+
+
 def _has_shared_item(
     rows: list[dict[str, object]],
     col: str,
@@ -449,12 +496,26 @@ def predict_build_preview(corpus: Corpus) -> list[dict[str, object]]:
     total = len(rows)
     total_seeds = sum(1 for r in rows if r.get(Col.IS_SEED))
 
+    # Los 6 conteos de columnas se acumulan en UNA pasada sobre las filas
+    # (antes: una pasada completa por columna).
+    col_counts = _count_rows_with_cols(
+        rows,
+        [
+            (Col.REFERENCES_ID, False),
+            (Col.AUTHORS_ID, False),
+            (Col.INSTITUTIONS_ID, False),
+            (Col.KEYWORDS_ID, False),
+            (Col.KEYWORDS_RAW, False),
+            (Col.CITED_BY_ID, True),
+        ],
+    )
+
     preview: list[dict[str, object]] = []
 
     # bibliographic_coupling: references_id, scope=full
     # No-vacía sii algún references_id aparece en ≥2 papers distintos.
     # (dos papers con refs disjuntas producen 0 aristas → caso trampa Nota 20)
-    n_refs_any = _count_rows_with_col(rows, Col.REFERENCES_ID)
+    n_refs_any = col_counts[(Col.REFERENCES_ID, False)]
     bc_empty = not _has_shared_item(rows, Col.REFERENCES_ID)
     if bc_empty:
         if n_refs_any == 0:
@@ -478,7 +539,7 @@ def predict_build_preview(corpus: Corpus) -> list[dict[str, object]]:
     # author_collab: authors_id, scope=full
     # No-vacía sii algún paper tiene ≥2 autores DISTINTOS no-None.
     # ([A1, A1] → tras dedup 1 único → 0 aristas, aunque len=2)
-    n_authors_any = _count_rows_with_col(rows, Col.AUTHORS_ID)
+    n_authors_any = col_counts[(Col.AUTHORS_ID, False)]
     ac_empty = not _has_paper_with_multi_distinct(rows, Col.AUTHORS_ID)
     if ac_empty:
         if n_authors_any == 0:
@@ -501,7 +562,7 @@ def predict_build_preview(corpus: Corpus) -> list[dict[str, object]]:
 
     # institution_collab: institutions_id, scope=full
     # No-vacía sii algún paper tiene ≥2 instituciones DISTINTAS no-None.
-    n_inst_any = _count_rows_with_col(rows, Col.INSTITUTIONS_ID)
+    n_inst_any = col_counts[(Col.INSTITUTIONS_ID, False)]
     ic_empty = not _has_paper_with_multi_distinct(rows, Col.INSTITUTIONS_ID)
     if ic_empty:
         if n_inst_any == 0:
@@ -526,8 +587,8 @@ def predict_build_preview(corpus: Corpus) -> list[dict[str, object]]:
     # No-vacía sii algún paper tiene ≥2 keywords DISTINTAS no-None.
     # Fix preferencial: si hay keywords_raw pero no keywords_id, thesaurus puede
     # generar keywords_id sin red; si no hay keywords_raw, se necesita seed --resolve.
-    n_kw_any = _count_rows_with_col(rows, Col.KEYWORDS_ID)
-    n_kw_raw = _count_rows_with_col(rows, Col.KEYWORDS_RAW)
+    n_kw_any = col_counts[(Col.KEYWORDS_ID, False)]
+    n_kw_raw = col_counts[(Col.KEYWORDS_RAW, False)]
     kw_empty = not _has_paper_with_multi_distinct(rows, Col.KEYWORDS_ID)
     if kw_empty:
         if n_kw_any == 0:
@@ -558,7 +619,7 @@ def predict_build_preview(corpus: Corpus) -> list[dict[str, object]]:
     # cocitation: cited_by_id, scope=seeds_only
     # No-vacía sii algún cited_by_id aparece en ≥2 seeds distintas.
     # (dos seeds con citantes disjuntos producen 0 aristas)
-    n_cited_any = _count_rows_with_col(rows, Col.CITED_BY_ID, seeds_only=True)
+    n_cited_any = col_counts[(Col.CITED_BY_ID, True)]
     coc_empty = not _has_shared_item(rows, Col.CITED_BY_ID, seeds_only=True)
     if coc_empty:
         if n_cited_any == 0:
@@ -627,7 +688,13 @@ class Networks:
         """
         kinds = list(_QUICK_KINDS)
 
-        if _has_cited_by_data(corpus):
+        # Materializar la tabla Arrow y el hash de contenido UNA vez para el
+        # lote completo: cada _build_artifact los reusa en vez de re-exportar
+        # y re-hashear el corpus por spec (ambos son función pura del corpus).
+        table = corpus.to_arrow()
+        corpus_hash = corpus._backend.corpus_hash()
+
+        if _has_cited_by_data(table):
             logger.info("Networks.quick: cited_by_id poblado — incluyendo co-citación.")
             kinds.append(NetworkKind.COCITATION)
         else:
@@ -639,4 +706,7 @@ class Networks:
             )
 
         specs = [NetworkSpec(kind=k, min_weight=min_weight) for k in kinds]
-        return [_build_artifact(corpus, spec) for spec in specs]
+        return [
+            _build_artifact(corpus, spec, table=table, corpus_hash=corpus_hash)
+            for spec in specs
+        ]
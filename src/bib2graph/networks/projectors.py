@@ -102,9 +102,13 @@ def _build_cooccurrence_graph(
             pair_count[(a, b)] += 1
 
     g: _Graph = nx.Graph()
-    for (a, b), weight in sorted(pair_count.items()):
-        if weight >= min_weight:
-            g.add_edge(a, b, weight=weight)
+    # add_edges_from con generador: el loop de inserción corre dentro de
+    # NetworkX en una sola llamada; el sorted preserva el orden determinista.
+    g.add_edges_from(
+        (a, b, {"weight": weight})
+        for (a, b), weight in sorted(pair_count.items())
+        if weight >= min_weight
+    )
 
     return g
 
@@ -174,9 +178,13 @@ def _build_shared_refs_graph(
             pair_count[(a, b)] += 1
 
     g: _Graph = nx.Graph()
-    for (a, b), weight in sorted(pair_count.items()):
-        if weight >= min_weight:
-            g.add_edge(a, b, weight=weight)
+    # add_edges_from con generador: el loop de inserción corre dentro de
+    # NetworkX en una sola llamada; el sorted preserva el orden determinista.
+    g.add_edges_from(
+        (a, b, {"weight": weight})
+        for (a, b), weight in sorted(pair_count.items())
+        if weight >= min_weight
+    )
 
     return g
 
@@ -207,7 +215,8 @@ class BibliographicCouplingProjector:
             Grafo de acoplamiento con ``weight`` en cada arista.
         """
         filtered = _filter_scope(table, scope)
-        rows = filtered.to_pylist()
+        # Solo se materializan las 2 columnas que usa la proyección
+        rows = filtered.select([Col.ID, Col.REFERENCES_ID]).to_pylist()
         return _build_shared_refs_graph(
             rows, Col.ID, Col.REFERENCES_ID, min_weight=min_weight
         )
@@ -238,7 +247,8 @@ class AuthorCollaborationProjector:
             Grafo de co-autoría con ``weight`` en cada arista.
         """
         filtered = _filter_scope(table, scope)
-        rows = filtered.to_pylist()
+        # Solo se materializan las 2 columnas que usa la proyección
+        rows = filtered.select([Col.ID, Col.AUTHORS_ID]).to_pylist()
         return _build_cooccurrence_graph(
             rows, Col.ID, Col.AUTHORS_ID, min_weight=min_weight
         )
@@ -269,7 +279,8 @@ class InstitutionCollaborationProjector:
             Grafo de colaboración institucional con ``weight`` en cada arista.
         """
         filtered = _filter_scope(table, scope)
-        rows = filtered.to_pylist()
+        # Solo se materializan las 2 columnas que usa la proyección
+        rows = filtered.select([Col.ID, Col.INSTITUTIONS_ID]).to_pylist()
         return _build_cooccurrence_graph(
             rows, Col.ID, Col.INSTITUTIONS_ID, min_weight=min_weight
         )
@@ -300,7 +311,8 @@ class KeywordCoOccurrenceProjector:
             Grafo de co-ocurrencia de keywords con ``weight`` en cada arista.
         """
         filtered = _filter_scope(table, scope)
-        rows = filtered.to_pylist()
+        # Solo se materializan las 2 columnas que usa la proyección
+        rows = filtered.select([Col.ID, Col.KEYWORDS_ID]).to_pylist()
         return _build_cooccurrence_graph(
             rows, Col.ID, Col.KEYWORDS_ID, min_weight=min_weight
         )
@@ -343,7 +355,8 @@ class CoCitationProjector:
             Grafo de co-citación con ``weight`` en cada arista.
         """
         filtered = _filter_scope(table, scope)
-        rows = filtered.to_pylist()
+        # Solo se materializan las 2 columnas que usa la proyección
+        rows = filtered.select([Col.ID, Col.CITED_BY_ID]).to_pylist()
         return _build_shared_refs_graph(
             rows, Col.ID, Col.CITED_BY_ID, min_weight=min_weight
         )
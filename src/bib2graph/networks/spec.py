@@ -153,13 +153,18 @@ def load_specs(path: str | Path) -> list[NetworkSpec]:
     return specs
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkArtifact:
     """Resultado de proyectar y analizar un corpus con una ``NetworkSpec``.
 
     Agrupa el grafo, las métricas, las comunidades, la asortatividad, el layout
     y la especificación que lo originó.
 
+    ``slots=True``: sin ``__dict__`` por instancia — los artefactos se
+    acumulan en listas (``Networks.quick``, ``b2g build --spec``) y el
+    atributo-set es fijo; slots baja la huella por objeto y convierte los
+    typos de atributo en ``AttributeError`` inmediato.
+
     Attributes:
         graph: Grafo NetworkX proyectado.
         metrics: Salida de ``network_metrics`` (densidad, componentes, clustering).
@@ -40,6 +40,7 @@ Decisiones de producto (Bifurcaciones B-G2-1/B-G2-2/B-G2-3):
 from __future__ import annotations
 
 import json
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -48,6 +49,7 @@ from bib2graph.service._identity import resolve_ident_to_row
 from bib2graph.service.errors import DataError, StoreError
 
 if TYPE_CHECKING:
+    from bib2graph.corpus import Corpus
     from bib2graph.workspace import Workspace
 
 
@@ -286,23 +288,29 @@ def get_scent(ws: Workspace, paper_id: str) -> dict[str, Any]:
     table = corpus.to_arrow()
     rows = table.to_pylist()
 
-    matching = [r for r in rows if str(r.get(Col.ID)) == paper_id]
-    if not matching:
+    # Una sola pasada sobre las filas resuelve el índice id→título y el
+    # lookup del paper pedido; el índice inverso de referencias queda en
+    # collect_item_to_papers, que es el primitivo compartido con foraging.
+    paper_row: dict[str, Any] | None = None
+    id_to_title: dict[str, str | None] = {}
+    for r in rows:
+        rid = r.get(Col.ID)
+        if not rid:
+            continue
+        rid_str = str(rid)
+        id_to_title[rid_str] = (
+            str(r.get(Col.TITLE)) if r.get(Col.TITLE) else None
+        )
+        if rid_str == paper_id:
+            paper_row = r
+    if paper_row is None:
         raise DataError(
             f"Paper '{paper_id}' no encontrado en el corpus. "
             "Verificá el id con 'b2g read list' o 'b2g status'."
         )
 
-    paper_row = matching[0]
-
     ref_to_papers = collect_item_to_papers(rows, Col.ID, Col.REFERENCES_ID)
 
-    id_to_title: dict[str, str | None] = {
-        str(r.get(Col.ID)): str(r.get(Col.TITLE)) if r.get(Col.TITLE) else None
-        for r in rows
-        if r.get(Col.ID)
-    }
-
     paper_refs: list[str] = list(paper_row.get(Col.REFERENCES_ID) or [])
     coupling_weights: dict[str, int] = {}
     for ref in paper_refs:
@@ -386,10 +394,6 @@ def get_network(ws: Workspace, kind: str) -> dict[str, Any]:
         DataError: Si ``kind`` es inválido o no hay red para la ronda viva.
         StoreError: Si el store no existe o está bloqueado.
     """
-    from bib2graph.networks.analyzer import network_metrics
-    from bib2graph.networks.facade import Networks
-    from bib2graph.networks.spec import NetworkSpec
-
     if kind not in _VALID_KINDS:
         valid = ", ".join(sorted(_VALID_KINDS))
         raise DataError(
@@ -398,6 +402,29 @@ def get_network(ws: Workspace, kind: str) -> dict[str, Any]:
 
     store = _open_readonly(ws.library_path)
     corpus = store.load()
+    return _network_payload(corpus, kind)
+
+
+def _network_payload(corpus: Corpus, kind: str) -> dict[str, Any]:
+    """Construye el payload ``{nodes, edges, metrics}`` de una red para ``corpus``.
+
+    Núcleo compartido por ``get_network`` y ``get_top``: recibe el corpus ya
+    cargado, de modo que los llamadores que necesitan varias redes de la
+    misma biblioteca la abran y carguen UNA sola vez.
+
+    Args:
+        corpus: Corpus ya cargado del store.
+        kind: Tipo de red (``NetworkKind`` como string, ya validado).
+
+    Returns:
+        Dict con ``nodes``, ``edges`` y ``metrics`` (mismo contrato que
+        ``get_network``).
+
+    Raises:
+        DataError: Si la construcción de la red falla.
+    """
+    from bib2graph.networks.facade import Networks
+    from bib2graph.networks.spec import NetworkSpec
 
     try:
         nk = NetworkKind(kind)
@@ -411,10 +438,10 @@ def get_network(ws: Workspace, kind: str) -> dict[str, Any]:
 
     graph = artifact.graph
 
-    # Nodos con atributos
+    # Nodos con atributos — ``nodes(data=True)`` entrega el dict de atributos
+    # en la misma iteración, sin un lookup ``graph.nodes[node]`` por nodo.
     nodes = []
-    for node in graph.nodes():
-        attrs = graph.nodes[node]
+    for node, attrs in graph.nodes(data=True):
         node_dict: dict[str, Any] = {
             "id": str(node),
             "label": attrs.get("label", str(node)),
@@ -430,7 +457,9 @@ def get_network(ws: Workspace, kind: str) -> dict[str, Any]:
         for u, v, data in graph.edges(data=True)
     ]
 
-    base_metrics = network_metrics(graph)
+    # Networks.build ya corrió network_metrics sobre este grafo; reusar el
+    # resultado del artifact evita re-recorrer nodos y aristas una segunda vez.
+    base_metrics = artifact.metrics
 
     n_communities: int = 0
     if artifact.communities:
@@ -771,17 +800,25 @@ def get_top(
     store = _open_readonly(ws.library_path)
     corpus = store.load()
     table = corpus.to_arrow()
+    # Acceso columnar: solo id y title se materializan (to_pylist() de la
+    # tabla completa crearía un dict de 24 columnas por fila solo para esto).
     id_to_title: dict[str, str | None] = {
-        str(r.get(Col.ID)): (str(r.get(Col.TITLE)) if r.get(Col.TITLE) else None)
-        for r in table.to_pylist()
-        if r.get(Col.ID)
+        str(pid): (str(title) if title else None)
+        for pid, title in zip(
+            table.column(Col.ID).to_pylist(),
+            table.column(Col.TITLE).to_pylist(),
+            strict=False,
+        )
+        if pid
     }
 
-    # Bloque "central": top N nodos por degree_centrality en --kind
-    central_net = get_network(ws, kind)
+    # Bloque "central": top N nodos por degree_centrality en --kind.
+    # El corpus ya está cargado arriba: _network_payload lo reusa, evitando
+    # re-abrir el store y re-cargar la biblioteca una vez por red pedida.
+    central_net = _network_payload(corpus, kind)
     sorted_nodes = sorted(
         central_net["nodes"],
-        key=lambda node: node["degree_centrality"],
+        key=itemgetter("degree_centrality"),
         reverse=True,
     )[:n]
 
@@ -804,12 +841,12 @@ def get_top(
     coc_net = (
         central_net
         if kind == NetworkKind.COCITATION
-        else get_network(ws, NetworkKind.COCITATION)
+        else _network_payload(corpus, NetworkKind.COCITATION)
     )
 
     sorted_edges = sorted(
         coc_net["edges"],
-        key=lambda e: e["weight"],
+        key=itemgetter("weight"),
         reverse=True,
     )[:n]
 
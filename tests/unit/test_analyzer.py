@@ -92,6 +92,19 @@ def test_network_metrics_triangulo(triangle_graph: nx.Graph) -> None:
     assert m["avg_clustering"] == pytest.approx(1.0)
 
 
+@pytest.mark.unit
+def test_network_metrics_componente_gigante() -> None:
+    """largest_component_size reporta el tamaño del componente mayor."""
+    g = nx.Graph()
+    g.add_edges_from([(0, 1), (1, 2)])  # componente de 3
+    g.add_edge(10, 11)  # componente de 2
+
+    m = network_metrics(g)
+
+    assert m["num_components"] == 2
+    assert m["largest_component_size"] == 3
+
+
 # ---------------------------------------------------------------------------
 # 2. centrality
 # ---------------------------------------------------------------------------
@@ -122,6 +135,28 @@ def test_centrality_triangulo(triangle_graph: nx.Graph) -> None:
         assert c["betweenness"][node] == pytest.approx(0.0)
 
 
+@pytest.mark.unit
+def test_centrality_aproximada_es_determinista(star_graph: nx.Graph) -> None:
+    """Con betweenness_samples el muestreo sembrado da el mismo resultado."""
+    c1 = centrality(star_graph, betweenness_samples=2)
+    c2 = centrality(star_graph, betweenness_samples=2)
+
+    assert c1["betweenness"] == c2["betweenness"]
+
+
+@pytest.mark.unit
+def test_centrality_aproximada_con_k_igual_n_es_exacta(
+    star_graph: nx.Graph,
+) -> None:
+    """Si los pivotes cubren todos los nodos, la aproximación es exacta."""
+    exacta = centrality(star_graph)
+    # betweenness_samples mayor que len(g) se recorta a len(g) → exacto
+    aprox = centrality(star_graph, betweenness_samples=100)
+
+    for node, valor in exacta["betweenness"].items():
+        assert aprox["betweenness"][node] == pytest.approx(valor)
+
+
 # ---------------------------------------------------------------------------
 # 3. detect_communities — fallo explícito si falta python-louvain
 # ---------------------------------------------------------------------------
@@ -761,3 +761,70 @@ def test_build_escribe_community_en_nodos_csv(tmp_path: Path) -> None:
         # Corpus con 0 nodos en todas las redes: chequeamos que GraphML exista
         graphml_files = list(artifacts_dir.rglob("*.graphml"))
         assert len(graphml_files) >= 1, "Debe haber al menos un archivo GraphML"
+
+
+# ---------------------------------------------------------------------------
+# 5. export --compress: GraphML comprimido (ADR 0050)
+# ---------------------------------------------------------------------------
+
+
+def _fabricate_networks_dir(base: Path) -> Path:
+    """Escribe un artefacto de build mínimo (1 red) para relectura en export."""
+    import networkx as nx
+
+    nets_dir = base / "networks"
+    kind_dir = nets_dir / "bibliographic_coupling"
+    kind_dir.mkdir(parents=True)
+    g = nx.Graph()
+    g.add_edge("doi:10.1/a", "doi:10.1/b", weight=2)
+    nx.write_graphml(g, str(kind_dir / "network.graphml"))
+    (kind_dir / "metrics.json").write_text(
+        json.dumps({"density": 1.0}), encoding="utf-8"
+    )
+    return nets_dir
+
+
+@pytest.mark.unit
+def test_export_compress_escribe_graphml_gz(tmp_path: Path) -> None:
+    """run_export(compress=True) escribe network.graphml.gz legible (ADR 0050)."""
+    import networkx as nx
+
+    from bib2graph.cli.commands.export import run_export
+
+    nets_dir = _fabricate_networks_dir(tmp_path)
+    out_dir = tmp_path / "exports"
+
+    data = run_export(
+        tmp_path / "investigacion.duckdb",
+        format="graphml",
+        out_dir=out_dir,
+        networks_dir=nets_dir,
+        compress=True,
+    )
+
+    gz_path = out_dir / "bibliographic_coupling" / "network.graphml.gz"
+    assert gz_path.exists()
+    assert not (out_dir / "bibliographic_coupling" / "network.graphml").exists()
+    assert str(gz_path) in data["files_written"]
+    # Round-trip: nx lee .graphml.gz directo (mismo grafo, mismo peso).
+    g2 = nx.read_graphml(str(gz_path))
+    assert g2.number_of_edges() == 1
+
+
+@pytest.mark.unit
+def test_export_compress_con_csv_es_usage_error(tmp_path: Path) -> None:
+    """--compress con --format csv es UsageError (exit 1), antes del workspace."""
+    from click.testing import CliRunner
+
+    from bib2graph.cli.commands.export import export_cmd
+
+    result = CliRunner().invoke(
+        export_cmd,
+        ["--format", "csv", "--compress", "--json"],
+        obj={"workspace": str(tmp_path)},
+    )
+
+    assert result.exit_code == 1
+    envelope = json.loads(result.output)
+    assert envelope["ok"] is False
+    assert envelope["error"]["code"] == "USAGE_ERROR"
@@ -0,0 +1,96 @@
+"""Tests del entry point liviano ``_entry`` y de ``python -m bib2graph``.
+
+Cubre (#207, ADR 0038):
+1. Fast path ``--version``/``-V``: exit 0 y salida idéntica a la del
+   ``version_option`` de Click (paridad byte a byte).
+2. Fallback ``0+unknown`` si el paquete no está instalado
+   (``PackageNotFoundError``), igual que ``bib2graph.__version__``.
+3. Delegación: cualquier otra invocación llega al grupo Click
+   (``--help`` imprime la ayuda del grupo con exit 0).
+4. ``-V`` registrado también en el grupo Click: ``b2g --workspace x -V``
+   no es error de uso.
+5. ``python -m bib2graph --version`` (vía ``__main__``) funciona end-to-end.
+
+Marcador: ``unit`` (sin red; subprocess solo para el caso ``-m``).
+"""
+
+from __future__ import annotations
+
+import importlib.metadata
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from bib2graph._entry import entry
+
+pytestmark = pytest.mark.unit
+
+
+def _click_version_output() -> str:
+    """Salida del ``version_option`` de Click para comparar paridad."""
+    from bib2graph.cli import b2g
+
+    result = CliRunner().invoke(b2g, ["--version"])
+    assert result.exit_code == 0
+    return result.output
+
+
+@pytest.mark.parametrize("flag", ["--version", "-V"])
+def test_fast_path_version_paridad_con_click(
+    flag: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """El fast path emite exactamente lo mismo que Click, con exit 0."""
+    monkeypatch.setattr("sys.argv", ["b2g", flag])
+    assert entry() == 0
+    out = capsys.readouterr().out
+    assert out == _click_version_output()
+    assert out == f"b2g, version {importlib.metadata.version('bib2graph')}\n"
+
+
+def test_fast_path_fallback_sin_instalar(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Checkout crudo (sin metadata instalada) → ``0+unknown``, no traceback."""
+
+    def _raise(_name: str) -> Any:
+        raise importlib.metadata.PackageNotFoundError("bib2graph")
+
+    monkeypatch.setattr("importlib.metadata.version", _raise)
+    monkeypatch.setattr("sys.argv", ["b2g", "--version"])
+    assert entry() == 0
+    assert capsys.readouterr().out == "b2g, version 0+unknown\n"
+
+
+def test_entry_delega_en_el_grupo_click(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Fuera del fast path, ``entry`` delega en ``bib2graph.cli.main``."""
+    monkeypatch.setattr("sys.argv", ["b2g", "--help"])
+    assert entry() == 0
+    out = capsys.readouterr().out
+    assert "b2g" in out
+    assert "init" in out  # subcomandos del grupo visibles en la ayuda
+
+
+def test_grupo_click_acepta_v_corta_en_cualquier_posicion(tmp_path: Any) -> None:
+    """``-V`` no es solo del fast path: Click la resuelve tras otras opciones."""
+    from bib2graph.cli import b2g
+
+    result = CliRunner().invoke(b2g, ["--workspace", str(tmp_path), "-V"])
+    assert result.exit_code == 0
+    assert result.output == _click_version_output()
+
+
+def test_python_m_bib2graph_version() -> None:
+    """``python -m bib2graph --version`` (``__main__`` → ``entry``) exit 0."""
+    proc = subprocess.run(
+        [sys.executable, "-m", "bib2graph", "--version"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0
+    assert proc.stdout.startswith("b2g, version ")
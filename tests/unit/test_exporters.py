@@ -121,6 +121,25 @@ def test_graphml_roundtrip_con_atributo_none(tmp_path: Path) -> None:
     assert "country" not in reloaded.nodes["B"]
 
 
+@pytest.mark.unit
+def test_graphml_comprimido_roundtrip(
+    simple_graph: nx.Graph,
+    results_dict: dict[str, object],
+    tmp_path: Path,
+) -> None:
+    """Con compress=True se escribe network.graphml.gz y el round-trip conserva el grafo."""
+    GraphMLExporter().export(simple_graph, results_dict, tmp_path, compress=True)
+
+    gz_path = tmp_path / "network.graphml.gz"
+    assert gz_path.exists()
+    assert not (tmp_path / "network.graphml").exists()
+
+    # nx.read_graphml descomprime .gz automáticamente
+    reloaded = nx.read_graphml(str(gz_path))
+    assert set(reloaded.nodes) == set(simple_graph.nodes)
+    assert float(reloaded.edges["A", "B"]["weight"]) == pytest.approx(3)
+
+
 # ---------------------------------------------------------------------------
 # 2. CsvExporter — smoke test
 # ---------------------------------------------------------------------------
@@ -16,3 +16,37 @@ def test_import_sin_efectos_colaterales() -> None:
     sys.modules.pop("bib2graph", None)
     modulo = importlib.import_module("bib2graph")
     assert modulo is not None
+
+
+def test_superficie_publica_sin_drift() -> None:
+    """``__all__`` y el mapa perezoso ``_LAZY`` son la MISMA superficie.
+
+    La superficie pública vive declarada dos veces (``__all__`` para
+    introspección, ``_LAZY`` para la resolución PEP 562).  Si divergen, un
+    símbolo documentado deja de resolverse (AttributeError) o se expone uno
+    no documentado.  Este guard los mantiene byte a byte en sincronía.
+    """
+    import bib2graph
+
+    assert set(bib2graph.__all__) == set(bib2graph._LAZY)
+
+
+def test_version_viene_de_metadata() -> None:
+    """``__version__`` se resuelve desde importlib.metadata (fuente única).
+
+    No hay literal hardcodeado en el paquete: la versión es la de packaging
+    (pyproject.toml), así release-please no puede dejarla desincronizada.
+    """
+    import importlib.metadata
+
+    import bib2graph
+
+    assert bib2graph.__version__ == importlib.metadata.version("bib2graph")
+
+
+def test_todos_los_simbolos_publicos_resuelven() -> None:
+    """Cada nombre de ``__all__`` resuelve vía el ``__getattr__`` perezoso."""
+    import bib2graph
+
+    for name in bib2graph.__all__:
+        assert getattr(bib2graph, name) is not None